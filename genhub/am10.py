@@ -16,8 +16,16 @@ import gzip
 import re
 import subprocess
 import sys
+import tempfile
 import genhub
 
+gt_stderr_suppress = re.compile(
+    'has not been previously introduced|'
+    'does not begin with "##gff-version"|'
+    'illegal uppercase attribute "Shift"|'
+    'has the wrong phase'
+)
+
 
 class Am10DB(genhub.genomedb.GenomeDB):
 
@@ -43,22 +51,24 @@ class Am10DB(genhub.genomedb.GenomeDB):
         return '%s/%s' % (self.specbase, self.protfilename)
 
     def format_gdna(self, instream, outstream, logstream=sys.stderr):
+        write = outstream.write
         for line in instream:
-            deflinematch = re.search('>gnl\|[^\|]+\|(\S+)', line)
-            if deflinematch:
-                seqid = deflinematch.group(1)
-                line = line.replace('>', '>%s ' % seqid)
-            print(line, end='', file=outstream)
+            if line.startswith('>gnl|'):
+                fields = line.split('|', 2)
+                if len(fields) == 3 and fields[2].strip() != '':
+                    seqid = fields[2].split()[0]
+                    line = line.replace('>', '>%s ' % seqid)
+            write(line)
 
     def format_prot(self, instream, outstream, logstream=sys.stderr):
+        write = outstream.write
         for line in instream:
             # No processing required currently.
             # If any is ever needed, do it here.
-            print(line, end='', file=outstream)
+            write(line)
 
     def format_gff3(self, logstream=sys.stderr, debug=False):
         cmds = list()
-        cmds.append('gunzip -c %s' % self.gff3path)
         cmds.append('genhub-glean-to-gff3.py')
         cmds.append('tidygff3')
         cmds.append('genhub-format-gff3.py --source am10 -')
@@ -68,15 +78,24 @@ class Am10DB(genhub.genomedb.GenomeDB):
         commands = ' | '.join(cmds)
         if debug:  # pragma: no cover
             print('DEBUG: running command: %s' % commands, file=logstream)
-        proc = subprocess.Popen(commands, shell=True, universal_newlines=True,
-                                stderr=subprocess.PIPE)
-        stdout, stderr = proc.communicate()
-        for line in stderr.split('\n'):  # pragma: no cover
-            if 'has not been previously introduced' not in line and \
-               'does not begin with "##gff-version"' not in line and \
-               'illegal uppercase attribute "Shift"' not in line and \
-               'has the wrong phase' not in line and \
-               line != '':
+
+        with tempfile.TemporaryFile(mode='w+t') as errstream:
+            proc = subprocess.Popen(commands, shell=True,
+                                    universal_newlines=True,
+                                    stdin=subprocess.PIPE,
+                                    stderr=errstream)
+            with genhub.genomedb.gzopen(self.gff3path, 'rt') as instream:
+                try:
+                    for line in instream:
+                        proc.stdin.write(line)
+                    proc.stdin.close()
+                except IOError:  # pragma: no cover
+                    pass
+            proc.wait()
+            errstream.seek(0)
+            stderr = errstream.read()
+        for line in stderr.splitlines():  # pragma: no cover
+            if line and not gt_stderr_suppress.search(line):
                 print(line, file=logstream)
         assert proc.returncode == 0, \
             'annot cleanup command failed: %s' % commands
@@ -19,8 +19,14 @@ from __future__ import print_function
 import re
 import subprocess
 import sys
+import tempfile
 import genhub
 
+gt_stderr_suppress = re.compile(
+    'has not been previously introduced|'
+    'does not begin with "##gff-version"'
+)
+
 
 class CrgDB(genhub.genomedb.GenomeDB):
 
@@ -49,24 +55,22 @@ class CrgDB(genhub.genomedb.GenomeDB):
         return '%s.gz' % self.config['annotation']
 
     def format_gdna(self, instream, outstream, logstream=sys.stderr):
+        write = outstream.write
         for line in instream:
             if line.startswith('>'):
                 line = line.replace('scaffold_', '%sScf_' % self.label)
                 line = line.replace('scaffold', '%sScf_' % self.label)
-            print(line, end='', file=outstream)
+            write(line)
 
     def format_prot(self, instream, outstream, logstream=sys.stderr):
+        write = outstream.write
         for line in instream:
             # No processing required currently.
             # If any is ever needed, do it here.
-            print(line, end='', file=outstream)
+            write(line)
 
     def format_gff3(self, logstream=sys.stderr, debug=False):
         cmds = list()
-        cmds.append('gunzip -c %s' % self.gff3path)
-        cmds.append("sed 's/	transcript	/	mRNA	/'")
-        cmds.append("sed 's/scaffold_/%sScf_/'" % self.label)
-        cmds.append("sed 's/scaffold/%sScf_/'" % self.label)
         cmds.append('genhub-format-gff3.py --source crg -')
         cmds.append('seq-reg.py - %s' % self.gdnafile)
         cmds.append('gt gff3 -sort -tidy -o %s -force' % self.gff3file)
@@ -74,13 +78,28 @@ class CrgDB(genhub.genomedb.GenomeDB):
         commands = ' | '.join(cmds)
         if debug:  # pragma: no cover
             print('DEBUG: running command: %s' % commands, file=logstream)
-        proc = subprocess.Popen(commands, shell=True, universal_newlines=True,
-                                stderr=subprocess.PIPE)
-        stdout, stderr = proc.communicate()
-        for line in stderr.split('\n'):  # pragma: no cover
-            if 'has not been previously introduced' not in line and \
-               'does not begin with "##gff-version"' not in line and \
-               line != '':
+
+        scfprefix = '%sScf_' % self.label
+        with tempfile.TemporaryFile(mode='w+t') as errstream:
+            proc = subprocess.Popen(commands, shell=True,
+                                    universal_newlines=True,
+                                    stdin=subprocess.PIPE,
+                                    stderr=errstream)
+            with genhub.genomedb.gzopen(self.gff3path, 'rt') as instream:
+                try:
+                    for line in instream:
+                        line = line.replace('\ttranscript\t', '\tmRNA\t', 1)
+                        line = line.replace('scaffold_', scfprefix, 1)
+                        line = line.replace('scaffold', scfprefix, 1)
+                        proc.stdin.write(line)
+                    proc.stdin.close()
+                except IOError:  # pragma: no cover
+                    pass
+            proc.wait()
+            errstream.seek(0)
+            stderr = errstream.read()
+        for line in stderr.splitlines():  # pragma: no cover
+            if line and not gt_stderr_suppress.search(line):
                 print(line, file=logstream)
         assert proc.returncode == 0, \
             'annot cleanup command failed: %s' % commands
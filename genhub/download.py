@@ -14,7 +14,30 @@
 from __future__ import print_function
 import gzip
 import pycurl
+import queue
 import sys
+import threading
+
+_local = threading.local()
+
+# Maximum number of received chunks buffered between the network thread and
+# the output writer thread before the transfer is throttled.
+buffer_chunks = 64
+
+
+def curl_handle():
+    """
+    Retrieve a reusable PycURL handle for the current thread.
+
+    Reusing a single handle allows PycURL to keep connections alive between
+    transfers, so that fetching many files from the same host pays the
+    connection setup cost (TCP/TLS handshake or FTP login) only once.
+    """
+    handle = getattr(_local, 'handle', None)
+    if handle is None:
+        handle = pycurl.Curl()
+        _local.handle = handle
+    return handle
 
 
 def url_download(urldata, localpath, compress=False, follow=True):
@@ -24,6 +47,11 @@ def url_download(urldata, localpath, compress=False, follow=True):
     - urldata: string(s), URL or list of URLs
     - localpath: path of the filename to which output will be written
     - compress: output compression
+
+    Received data is handed off to a dedicated writer thread through a
+    bounded queue, so network transfer and (optionally gzip-compressed)
+    disk output overlap instead of alternating. URLs are fetched in the
+    order given, so multi-part downloads are concatenated deterministically.
     """
     urls = urldata
     if isinstance(urldata, str):
@@ -33,16 +61,41 @@ def url_download(urldata, localpath, compress=False, follow=True):
     if compress is True:
         openfunc = gzip.open
 
-    with openfunc(localpath, 'wb') as out:
+    chunks = queue.Queue(maxsize=buffer_chunks)
+    writerfail = list()
+
+    def write_chunks():
+        try:
+            with openfunc(localpath, 'wb') as out:
+                while True:
+                    chunk = chunks.get()
+                    if chunk is None:
+                        return
+                    out.write(chunk)
+        except Exception as e:  # pragma: no cover
+            writerfail.append(e)
+            # Keep draining so the network thread never blocks on a full
+            # queue after the writer has failed.
+            while chunks.get() is not None:
+                pass
+
+    writer = threading.Thread(target=write_chunks)
+    writer.start()
+    try:
         for url in urls:
             try:
-                c = pycurl.Curl()
+                c = curl_handle()
                 c.setopt(c.URL, url)
-                c.setopt(c.WRITEDATA, out)
-                if follow:
-                    c.setopt(c.FOLLOWLOCATION, True)
+                c.setopt(c.WRITEFUNCTION, chunks.put)
+                c.setopt(c.FOLLOWLOCATION, follow)
                 c.perform()
-                c.close()
             except pycurl.error as e:
                 print('Error: unable to download URL::', url, file=sys.stderr)
+                c.close()
+                _local.handle = None
                 raise e
+    finally:
+        chunks.put(None)
+        writer.join()
+    if writerfail:  # pragma: no cover
+        raise writerfail[0]
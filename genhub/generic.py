@@ -17,8 +17,16 @@ import os
 import re
 import subprocess
 import sys
+import tempfile
 import genhub
 
+gt_stderr_suppress = re.compile(
+    'has not been previously introduced|'
+    'does not begin with "##gff-version"|'
+    'illegal uppercase attribute "Shift"|'
+    'has the wrong phase'
+)
+
 
 class GenericDB(genhub.genomedb.GenomeDB):
 
@@ -42,7 +50,7 @@ class GenericDB(genhub.genomedb.GenomeDB):
         return self.config['prot']
 
     def download(self, logstream=sys.stderr):
-        subprocess.call(['mkdir', '-p', self.dbdir])
+        os.makedirs(self.dbdir, exist_ok=True)
         if logstream is not None:  # pragma: no cover
             msg = '[GenHub: %s] checking input files' % self.config['species']
             print(msg, file=logstream)
@@ -54,24 +62,22 @@ class GenericDB(genhub.genomedb.GenomeDB):
             'proetin file {} does not exist'.format(self.protpath)
 
     def format_gdna(self, instream, outstream, logstream=sys.stderr):
-        subprocess.call(['mkdir', '-p', self.dbdir])
+        os.makedirs(self.dbdir, exist_ok=True)
+        write = outstream.write
         for line in instream:
             if line.strip() == '':
                 continue
-            print(line, end='', file=outstream)
+            write(line)
 
     def format_prot(self, instream, outstream, logstream=sys.stderr):
+        write = outstream.write
         for line in instream:
             if line.strip() == '':
                 continue
-            print(line, end='', file=outstream)
+            write(line)
 
     def format_gff3(self, logstream=sys.stderr, debug=False):
         cmds = list()
-        if self.gff3path.endswith('.gz'):  # pragma: no cover
-            cmds.append('gunzip -c %s' % self.gff3path)
-        else:
-            cmds.append('cat %s' % self.gff3path)
         cmds.append('seq-reg.py - %s' % self.gdnafile)
         cmds.append('genhub-format-gff3.py --source local -')
         cmds.append('gt gff3 -sort -tidy -o %s -force' % self.gff3file)
@@ -79,15 +85,28 @@ class GenericDB(genhub.genomedb.GenomeDB):
         commands = ' | '.join(cmds)
         if debug:  # pragma: no cover
             print('DEBUG: running command: %s' % commands, file=logstream)
-        proc = subprocess.Popen(commands, shell=True, universal_newlines=True,
-                                stderr=subprocess.PIPE)
-        stdout, stderr = proc.communicate()
-        for line in stderr.split('\n'):  # pragma: no cover
-            if 'has not been previously introduced' not in line and \
-               'does not begin with "##gff-version"' not in line and \
-               'illegal uppercase attribute "Shift"' not in line and \
-               'has the wrong phase' not in line and \
-               line != '':
+
+        if self.gff3path.endswith('.gz'):  # pragma: no cover
+            instream = genhub.genomedb.gzopen(self.gff3path, 'rt')
+        else:
+            instream = open(self.gff3path, 'r')
+        with tempfile.TemporaryFile(mode='w+t') as errstream:
+            proc = subprocess.Popen(commands, shell=True,
+                                    universal_newlines=True,
+                                    stdin=subprocess.PIPE,
+                                    stderr=errstream)
+            try:
+                for line in instream:
+                    proc.stdin.write(line)
+                proc.stdin.close()
+            except IOError:  # pragma: no cover
+                pass
+            instream.close()
+            proc.wait()
+            errstream.seek(0)
+            stderr = errstream.read()
+        for line in stderr.splitlines():  # pragma: no cover
+            if line and not gt_stderr_suppress.search(line):
                 print(line, file=logstream)
         assert proc.returncode == 0, \
             'annot cleanup command failed: %s' % commands
@@ -20,18 +20,64 @@ specifics for managing data from a particular source.
 """
 
 from __future__ import print_function
+import concurrent.futures
 import glob
 import gzip
 import hashlib
+import io
 import os
-import subprocess
+import re
 import sys
-import tempfile
 import genhub
 try:
     FileNotFoundError
 except NameError:  # pragma: no cover
     FileNotFoundError = IOError
+try:  # pragma: no cover
+    import rapidgzip
+except ImportError:
+    rapidgzip = None
+try:  # pragma: no cover
+    import indexed_gzip
+except ImportError:
+    indexed_gzip = None
+
+
+def gzopen(filepath, mode='rt'):
+    """
+    Open a gzip-compressed file for reading.
+
+    Decompression of genome-scale data files is a bottleneck for the
+    pre-processing tasks, so this function uses the optional rapidgzip
+    package (multithreaded decompression) when it is installed, and falls
+    back on the standard library's gzip module otherwise.
+    """
+    if rapidgzip is not None:  # pragma: no cover
+        stream = rapidgzip.open(filepath, parallelization=os.cpu_count())
+        if 't' in mode:
+            stream = io.TextIOWrapper(stream)
+        return stream
+    return gzip.open(filepath, mode)
+
+
+def build_gzip_index(filepath):
+    """
+    Persist a seek-point index alongside a gzip-compressed data file.
+
+    Plain gzip only supports sequential decompression, so seeking into an
+    already-downloaded file means decompressing everything up to the target
+    offset. When the optional indexed_gzip package is installed, this
+    function exports a reusable index (`<filename>.gzidx`) that downstream
+    consumers can load for constant-time random access; without the
+    package, it is a no-op.
+    """
+    if indexed_gzip is not None:  # pragma: no cover
+        indexfile = filepath + '.gzidx'
+        with indexed_gzip.IndexedGzipFile(filepath) as gzfile:
+            gzfile.build_full_index()
+            gzfile.export_index(indexfile)
+        return indexfile
+    return None
 
 
 class GenomeDB(object):
@@ -185,40 +231,59 @@ class GenomeDB(object):
 
     def download_gdna(self, logstream=sys.stderr):  # pragma: no cover
         """Download genomic DNA sequence."""
-        subprocess.call(['mkdir', '-p', self.dbdir])
+        os.makedirs(self.dbdir, exist_ok=True)
         if logstream is not None:
             logmsg = '[GenHub: %s] ' % self.config['species']
             logmsg += 'download genome sequence from %r' % self
             print(logmsg, file=logstream)
         genhub.download.url_download(self.gdnaurl, self.gdnapath,
                                      compress=self.compress_gdna)
+        if self.gdnapath.endswith('.gz'):
+            build_gzip_index(self.gdnapath)
 
     def download_gff3(self, logstream=sys.stderr):  # pragma: no cover
         """Download genome annotation."""
-        subprocess.call(['mkdir', '-p', self.dbdir])
+        os.makedirs(self.dbdir, exist_ok=True)
         if logstream is not None:
             logmsg = '[GenHub: %s] ' % self.config['species']
             logmsg += 'download genome annotation from %r' % self
             print(logmsg, file=logstream)
         genhub.download.url_download(self.gff3url, self.gff3path,
                                      compress=self.compress_gff3)
+        if self.gff3path.endswith('.gz'):
+            build_gzip_index(self.gff3path)
 
     def download_prot(self, logstream=sys.stderr):  # pragma: no cover
         """Download protein sequences."""
-        subprocess.call(['mkdir', '-p', self.dbdir])
+        os.makedirs(self.dbdir, exist_ok=True)
         if logstream is not None:
             logmsg = '[GenHub: %s] ' % self.config['species']
             logmsg += 'download protein sequences from %r' % self
             print(logmsg, file=logstream)
         genhub.download.url_download(self.proturl, self.protpath,
                                      compress=self.compress_prot)
+        if self.protpath.endswith('.gz'):
+            build_gzip_index(self.protpath)
 
     def download(self, logstream=sys.stderr):  # pragma: no cover
-        """Run download task."""
-        subprocess.call(['mkdir', '-p', self.dbdir])
-        self.download_gdna(logstream)
-        self.download_gff3(logstream)
-        self.download_prot(logstream)
+        """
+        Run download task.
+
+        The three data files are independent, and retrieving them is pure
+        I/O wait, so the downloads are dispatched to a small thread pool
+        and fetched concurrently.
+        """
+        os.makedirs(self.dbdir, exist_ok=True)
+        downloads = [self.download_gdna, self.download_gff3,
+                     self.download_prot]
+        pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(downloads)
+        )
+        with pool:
+            futures = [pool.submit(download, logstream)
+                       for download in downloads]
+            for future in futures:
+                future.result()
 
     def prep(self, logstream=sys.stderr, verify=True,
              strict=True):  # pragma: no cover
@@ -257,10 +322,10 @@ class GenomeDB(object):
                    'prot': self.protfile}[datatype]
         if datatype != 'gff3':
             if infile.endswith('.gz'):
-                instream = gzip.open(infile, 'rt')
+                instream = gzopen(infile, 'rt')
             else:
-                instream = open(infile, 'r')
-            outstream = open(outfile, 'w')
+                instream = open(infile, 'r', buffering=1 << 20)
+            outstream = open(outfile, 'w', buffering=1 << 20)
 
         if datatype == 'gdna':
             self.format_gdna(instream, outstream, logstream)
@@ -307,27 +372,36 @@ class GenomeDB(object):
     def preprocess_prot(self, logstream=sys.stderr, verify=True, strict=True):
         self.preprocess('prot', logstream, verify, strict)
 
-    def filter_file(self):
+    def filter_patterns(self):
         """
-        Write exclusion filter to a temporary file and return.
-
-        Data configurations may include an optional `annotfilter` with patterns
-        to discard from the input annotation a la `grep -v`. This function
-        retrieves the pattern(s) from the genome configuration and writes them
-        to a temporary file that can be used in a `grep -vf` command. The
-        calling function is responsible for unlinking the temporary file from
-        the operating system.
+        Retrieve exclusion filter patterns from the genome configuration.
+
+        Data configurations may include an optional `annotfilter` with
+        patterns to discard from the input annotation a la `grep -v`. This
+        function returns the pattern(s) as a list, or None if the
+        configuration includes no filter.
         """
         if 'annotfilter' not in self.config:
             return None
-        excludefile = tempfile.NamedTemporaryFile(mode='wt', delete=False)
         if isinstance(self.config['annotfilter'], str):
-            print(self.config['annotfilter'], file=excludefile)
-        else:
-            for exclusion in self.config['annotfilter']:
-                print(exclusion, file=excludefile)
-        excludefile.close()
-        return excludefile
+            return [self.config['annotfilter']]
+        return list(self.config['annotfilter'])
+
+    def filter_regex(self):
+        """
+        Compile the exclusion filter into a single regular expression.
+
+        The configured `annotfilter` patterns are regular expressions, just
+        as they were for `grep -vf` (the Att6 config anchors with `^ChrC`,
+        for example). A line matching any of the patterns matches the
+        compiled alternation, so the input annotation can be screened in a
+        single pass regardless of how many patterns are configured. Returns
+        None if the configuration includes no filter.
+        """
+        patterns = self.filter_patterns()
+        if patterns is None:
+            return None
+        return re.compile('|'.join('(?:%s)' % p for p in patterns))
 
     def file_sha1(self, filepath):
         """
@@ -336,7 +410,7 @@ class GenomeDB(object):
         sha = hashlib.sha1()
         with open(filepath, 'rb') as f:
             while True:
-                block = f.read(2**10)
+                block = f.read(1 << 20)
                 if not block:
                     break
                 sha.update(block)
@@ -363,16 +437,12 @@ class GenomeDB(object):
         """
         dbfiles = glob.glob(self.dbdir + '/*')
         files_deleted = list()
-        suffixes = ['.iloci.fa', '.iloci.gff3', '.miloci.gff3', '.tsv']
+        suffixes = ('.iloci.fa', '.iloci.gff3', '.miloci.gff3', '.tsv')
+        origfiles = (self.gdnapath, self.gff3path, self.protpath)
         for dbfile in dbfiles:
-            tokeep = False
-            for suffix in suffixes:
-                if dbfile.endswith(suffix):
-                    tokeep = True
-                    break
-            if tokeep:
+            if dbfile.endswith(suffixes):
                 continue
-            if dbfile in [self.gdnapath, self.gff3path, self.protpath]:
+            if dbfile in origfiles:
                 if not fullclean:
                     continue
             if patterns_to_keep:
@@ -443,17 +513,35 @@ def test_props():
     assert db.source == 'crg'
 
 
-def test_filter_file():
-    """GenomeDB: filter file"""
+def test_filter_patterns():
+    """GenomeDB: filter patterns"""
+    db = genhub.test_registry.genome('Lalb')
+    assert db.filter_patterns() is None
+
+    db = genhub.test_registry.genome('Drer')
+    assert db.filter_patterns() == ['NC_002333.2']
+
+    db.config['annotfilter'] = ['NC_002333.2', 'NW_003336701.1']
+    assert db.filter_patterns() == ['NC_002333.2', 'NW_003336701.1']
+
+
+def test_filter_regex():
+    """GenomeDB: compiled filter regex"""
     db = genhub.test_registry.genome('Lalb')
-    assert db.filter_file() is None
+    assert db.filter_regex() is None
 
     db = genhub.test_registry.genome('Drer')
-    ff = db.filter_file()
-    with open(ff.name, 'r') as infile:
-        excludestr = infile.read()
-        assert excludestr.strip() == 'NC_002333.2'
-    os.unlink(ff.name)
+    db.config['annotfilter'] = ['NC_002333.2', 'NW_003336701.1']
+    regex = db.filter_regex()
+    assert regex.search('NC_002333.2\tRefSeq\tregion\t1\t100\n')
+    assert regex.search('NW_003336701.1\tRefSeq\tgene\t1\t100\n')
+    assert regex.search('NC_999999.9\tRefSeq\tregion\t1\t100\n') is None
+
+    db.config['annotfilter'] = ['^ChrC', '^ChrM']
+    regex = db.filter_regex()
+    assert regex.search('ChrC\tTAIR6\tgene\t1\t100\n')
+    assert regex.search('ChrM\tTAIR6\tgene\t1\t100\n')
+    assert regex.search('Chr5\tTAIR6\tgene\t1\t100\n') is None
 
 
 def test_compress():
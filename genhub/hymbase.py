@@ -21,8 +21,22 @@ import gzip
 import re
 import subprocess
 import sys
+import tempfile
 import genhub
 
+hymbase_stderr_suppress = re.compile(
+    'has not been previously introduced|'
+    'does not begin with "##gff-version"|'
+    'has the wrong phase'
+)
+
+beebase_stderr_suppress = re.compile(
+    'has not been previously introduced|'
+    'does not begin with "##gff-version"|'
+    'illegal uppercase attribute "Shift"|'
+    'has the wrong phase'
+)
+
 
 class HymBaseDB(genhub.genomedb.GenomeDB):
 
@@ -58,21 +72,19 @@ class HymBaseDB(genhub.genomedb.GenomeDB):
         self.format_fasta(instream, outstream, logstream)
 
     def format_fasta(self, instream, outstream, logstream=sys.stderr):
+        write = outstream.write
         for line in instream:
             if line.startswith('>gnl|'):
-                deflinematch = re.search('>gnl\|[^\|]+\|(\S+)', line)
-                assert deflinematch, line
-                protid = deflinematch.group(1)
+                # Deflines look like `>gnl|Amel|ID ...`; pull out the third
+                # pipe-delimited field without invoking the regex engine.
+                fields = line.split('|', 2)
+                assert len(fields) == 3 and fields[2].strip() != '', line
+                protid = fields[2].split()[0]
                 line = line.replace('>', '>%s ' % protid)
-            print(line, end='', file=outstream)
+            write(line)
 
     def format_gff3(self, logstream=sys.stderr, debug=False):
         cmds = list()
-        cmds.append('gunzip -c %s' % self.gff3path)
-        if 'annotfilter' in self.config:
-            excludefile = self.filter_file()
-            cmds.append('grep -vf %s' % excludefile.name)
-        cmds.append("grep -v '\tregion\t'")
         cmds.append('genhub-uniq.py')
         cmds.append('genhub-namedup.py')
         cmds.append('tidygff3')
@@ -83,14 +95,29 @@ class HymBaseDB(genhub.genomedb.GenomeDB):
         commands = 'bash -o pipefail -c "%s"' % ' | '.join(cmds)
         if debug:  # pragma: no cover
             print('DEBUG: running command: %s' % commands, file=logstream)
-        proc = subprocess.Popen(commands, shell=True, universal_newlines=True,
-                                stderr=subprocess.PIPE)
-        stdout, stderr = proc.communicate()
-        for line in stderr.split('\n'):  # pragma: no cover
-            if 'has not been previously introduced' not in line and \
-               'does not begin with "##gff-version"' not in line and \
-               'has the wrong phase' not in line and \
-               line != '':
+
+        excluderegex = self.filter_regex()
+        with tempfile.TemporaryFile(mode='w+t') as errstream:
+            proc = subprocess.Popen(commands, shell=True,
+                                    universal_newlines=True,
+                                    stdin=subprocess.PIPE,
+                                    stderr=errstream)
+            with genhub.genomedb.gzopen(self.gff3path, 'rt') as instream:
+                try:
+                    for line in instream:
+                        if '\tregion\t' in line:
+                            continue
+                        if excluderegex and excluderegex.search(line):
+                            continue
+                        proc.stdin.write(line)
+                    proc.stdin.close()
+                except IOError:  # pragma: no cover
+                    pass
+            proc.wait()
+            errstream.seek(0)
+            stderr = errstream.read()
+        for line in stderr.splitlines():  # pragma: no cover
+            if line and not hymbase_stderr_suppress.search(line):
                 print(line, file=logstream)
         assert proc.returncode == 0, \
             'annot cleanup command failed: %s' % commands
@@ -153,25 +180,26 @@ class BeeBaseDB(HymBaseDB):
         return 'BeeBase'
 
     def format_gdna(self, instream, outstream, logstream=sys.stderr):
+        write = outstream.write
         for line in instream:
             if line.startswith('>scaffold'):
                 line = line.replace('scaffold', '%sScf_' % self.label)
             elif line.startswith('>Group'):
                 line = line.replace('Group', '%sGroup' % self.label)
-            print(line, end='', file=outstream)
+            write(line)
 
     def format_prot(self, instream, outstream, logstream=sys.stderr):
+        write = outstream.write
         for line in instream:
             if line.startswith('>gnl|'):
-                deflinematch = re.search('>gnl\|[^\|]+\|(\S+)', line)
-                assert deflinematch, line
-                protid = deflinematch.group(1)
+                fields = line.split('|', 2)
+                assert len(fields) == 3 and fields[2].strip() != '', line
+                protid = fields[2].split()[0]
                 line = line.replace('>', '>%s ' % protid)
-            print(line, end='', file=outstream)
+            write(line)
 
     def format_gff3(self, logstream=sys.stderr, debug=False):
         cmds = list()
-        cmds.append('gunzip -c %s' % self.gff3path)
         cmds.append('genhub-namedup.py')
         cmds.append("sed 's/scaffold/%sScf_/'" % self.label)
         cmds.append("sed 's/Group/%sGroup/'" % self.label)
@@ -183,15 +211,24 @@ class BeeBaseDB(HymBaseDB):
         commands = 'bash -o pipefail -c "%s"' % ' | '.join(cmds)
         if debug:  # pragma: no cover
             print('DEBUG: running command: %s' % commands, file=logstream)
-        proc = subprocess.Popen(commands, shell=True, universal_newlines=True,
-                                stderr=subprocess.PIPE)
-        stdout, stderr = proc.communicate()
-        for line in stderr.split('\n'):  # pragma: no cover
-            if 'has not been previously introduced' not in line and \
-               'does not begin with "##gff-version"' not in line and \
-               'illegal uppercase attribute "Shift"' not in line and \
-               'has the wrong phase' not in line and \
-               line != '':
+
+        with tempfile.TemporaryFile(mode='w+t') as errstream:
+            proc = subprocess.Popen(commands, shell=True,
+                                    universal_newlines=True,
+                                    stdin=subprocess.PIPE,
+                                    stderr=errstream)
+            with genhub.genomedb.gzopen(self.gff3path, 'rt') as instream:
+                try:
+                    for line in instream:
+                        proc.stdin.write(line)
+                    proc.stdin.close()
+                except IOError:  # pragma: no cover
+                    pass
+            proc.wait()
+            errstream.seek(0)
+            stderr = errstream.read()
+        for line in stderr.splitlines():  # pragma: no cover
+            if line and not beebase_stderr_suppress.search(line):
                 print(line, file=logstream)
         assert proc.returncode == 0, \
             'annot cleanup command failed: %s' % commands
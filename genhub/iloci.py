@@ -15,6 +15,11 @@ import subprocess
 import sys
 import genhub
 
+xtract_stderr_suppress = re.compile(
+    'has not been previously introduced|'
+    'does not begin with "##gff-version"'
+)
+
 
 def intervals(db, delta=500, ilcformat='{}ILC-%05lu', logstream=sys.stderr):
     """
@@ -110,10 +115,8 @@ def sequences(db, logstream=sys.stderr):
         proc = subprocess.Popen(cmd, stderr=subprocess.PIPE,
                                 universal_newlines=True)
         stdout, stderr = proc.communicate()
-        for line in stderr.split('\n'):
-            if 'has not been previously introduced' not in line and \
-               'does not begin with "##gff-version"' not in line and \
-               line != '':  # pragma: no cover
+        for line in stderr.splitlines():  # pragma: no cover
+            if line and not xtract_stderr_suppress.search(line):
                 print(line, file=logstream)
         assert proc.returncode == 0, 'command failed: ' + command
 
@@ -15,6 +15,11 @@ import subprocess
 import sys
 import genhub
 
+gt_stderr_suppress = re.compile(
+    'has not been previously introduced|'
+    'does not begin with "##gff-version"'
+)
+
 
 def mrna_exons(instream, convert=False, keepMrnas=False, usecds=False):
     """
@@ -103,10 +108,8 @@ def mature_mrna_intervals(db, logstream=sys.stderr):
         proc = subprocess.Popen(cmd, stderr=subprocess.PIPE,
                                 universal_newlines=True)
         _, stderr = proc.communicate()
-        for line in stderr.split('\n'):  # pragma: no cover
-            if 'has not been previously introduced' not in line and \
-               'does not begin with "##gff-version"' not in line and \
-               line != '':
+        for line in stderr.splitlines():  # pragma: no cover
+            if line and not gt_stderr_suppress.search(line):
                 print(line, file=logstream)
 
 
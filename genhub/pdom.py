@@ -47,16 +47,18 @@ class PdomDB(genhub.genomedb.GenomeDB):
         return 'https://ndownloader.figshare.com/files/3558059'
 
     def format_gdna(self, instream, outstream, logstream=sys.stderr):
+        write = outstream.write
         for line in instream:
             # No processing required currently.
             # If any is ever needed, do it here.
-            print(line, end='', file=outstream)
+            write(line)
 
     def format_prot(self, instream, outstream, logstream=sys.stderr):
+        write = outstream.write
         for line in instream:
             # No processing required currently.
             # If any is ever needed, do it here.
-            print(line, end='', file=outstream)
+            write(line)
 
     def format_gff3(self, logstream=sys.stderr, debug=False):
         command = ['genhub-format-gff3.py', '--source', 'pdom', '--outfile',
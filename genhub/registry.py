@@ -11,16 +11,26 @@
 """Module implementing a registry for handling genome configuration files."""
 
 from __future__ import print_function
+import copy
 import glob
 import os
 import pkg_resources
 import yaml
 import genhub
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as YamlLoader
 try:
     FileNotFoundError
 except NameError:  # pragma: no cover
     FileNotFoundError = IOError
 
+# Parsed genome configs, keyed by file path and modification time. Every
+# `Registry` re-reads the same installed config files, so parse each file
+# once and hand out copies.
+_config_cache = dict()
+
 
 class Registry(object):
 
@@ -87,11 +97,17 @@ class Registry(object):
         Parse reference genome config in YAML format.
 
         If `config` is a string it is treated as a filename, otherwise as a
-        file handle or similar object.
+        file handle or similar object. Configs parsed from files are cached,
+        and callers receive a fresh copy they are free to modify.
         """
         if isinstance(config, str):
-            config = open(config, 'r')
-        return yaml.safe_load(config)
+            cachekey = (config, os.stat(config).st_mtime)
+            if cachekey not in _config_cache:
+                with open(config, 'r') as infile:
+                    _config_cache[cachekey] = yaml.load(infile,
+                                                        Loader=YamlLoader)
+            return copy.deepcopy(_config_cache[cachekey])
+        return yaml.load(config, Loader=YamlLoader)
 
     def parse_batch_config(self, config):
         """
@@ -214,3 +230,7 @@ def test_parse_genome_config():
     assert len(config) == 1
     assert 'Hlab' in config
     assert config['Hlab']['common'] == 'blueberry bee'
+
+    cachedconfig = registry.parse_genome_config('genhub/genomes/Hlab.yml')
+    assert cachedconfig == config
+    assert cachedconfig is not config
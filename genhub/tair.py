@@ -19,12 +19,18 @@ template.
 from __future__ import print_function
 import filecmp
 import gzip
-import os
 import re
 import subprocess
 import sys
+import tempfile
 import genhub
 
+gt_stderr_suppress = re.compile(
+    'has not been previously introduced|'
+    'does not begin with "##gff-version"|'
+    'more than one pseudogene attribute'
+)
+
 
 class TairDB(genhub.genomedb.GenomeDB):
 
@@ -73,18 +79,14 @@ class TairDB(genhub.genomedb.GenomeDB):
         return self.config['prot_url']
 
     def format_fasta(self, instream, outstream, logstream=sys.stderr):
+        write = outstream.write
         for line in instream:
             # No processing required.
             # If any is ever needed again, do it here.
-            print(line, end='', file=outstream)
+            write(line)
 
     def format_gff3(self, logstream=sys.stderr, debug=False):
         cmds = list()
-        cmds.append('gunzip -c %s' % self.gff3path)
-        if 'annotfilter' in self.config:  # pragma: no cover
-            excludefile = self.filter_file()
-            cmds.append('grep -vf %s' % excludefile.name)
-        cmds.append('sed "s/Index=/index=/"')
         cmds.append('tidygff3')
         cmds.append('genhub-format-gff3.py --source tair -')
         cmds.append('gt gff3 -sort -tidy -o %s -force' % self.gff3file)
@@ -92,19 +94,32 @@ class TairDB(genhub.genomedb.GenomeDB):
         commands = ' | '.join(cmds)
         if debug:  # pragma: no cover
             print('DEBUG: running command: %s' % commands, file=logstream)
-        proc = subprocess.Popen(commands, shell=True, universal_newlines=True,
-                                stderr=subprocess.PIPE)
-        stdout, stderr = proc.communicate()
-        for line in stderr.split('\n'):  # pragma: no cover
-            if 'has not been previously introduced' not in line and \
-               'does not begin with "##gff-version"' not in line and \
-               'more than one pseudogene attribute' not in line and \
-               line != '':
+
+        excluderegex = self.filter_regex()
+        with tempfile.TemporaryFile(mode='w+t') as errstream:
+            proc = subprocess.Popen(commands, shell=True,
+                                    universal_newlines=True,
+                                    stdin=subprocess.PIPE,
+                                    stderr=errstream)
+            with genhub.genomedb.gzopen(self.gff3path, 'rt') as instream:
+                try:
+                    for line in instream:
+                        if excluderegex and \
+                                excluderegex.search(line):  # pragma: no cover
+                            continue
+                        line = line.replace('Index=', 'index=', 1)
+                        proc.stdin.write(line)
+                    proc.stdin.close()
+                except IOError:  # pragma: no cover
+                    pass
+            proc.wait()
+            errstream.seek(0)
+            stderr = errstream.read()
+        for line in stderr.splitlines():  # pragma: no cover
+            if line and not gt_stderr_suppress.search(line):
                 print(line, file=logstream)
         assert proc.returncode == 0, \
             'annot cleanup command failed: %s' % commands
-        if 'annotfilter' in self.config:  # pragma: no cover
-            os.unlink(excludefile.name)
 
     def gff3_protids(self, instream):
         protids = dict()
@@ -14,6 +14,8 @@ import re
 import sys
 import genhub
 
+seqreg_regex = re.compile(r'##sequence-region(\s+)(\S+)')
+
 
 class FeatureFormatter(object):
     """Load features from GFF3, parse and (re-)attach accession numbers."""
@@ -244,8 +246,10 @@ def format_prefix(line, prefix):
     if len(line.split('\t')) == 9:
         return prefix + line
     elif line.startswith('##sequence-region'):
-        return re.sub('##sequence-region(\s+)(\S+)',
-                      '##sequence-region\g<1>%s\g<2>' % args.prefix, line)
+        def repl(match):
+            return '##sequence-region' + match.group(1) + prefix \
+                + match.group(2)
+        return seqreg_regex.sub(repl, line)
 
 
 def main():
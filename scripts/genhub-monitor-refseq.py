@@ -15,7 +15,6 @@ import datetime
 import glob
 import os
 import shutil
-import subprocess
 import sys
 import genhub
 
@@ -47,7 +46,7 @@ class GenomeDBCache(object):
 
     def copy2cache(self, existingfile, newfile):
         newdir = os.path.dirname(newfile)
-        subprocess.call(['mkdir', '-p', newdir])
+        os.makedirs(newdir, exist_ok=True)
         shutil.copy2(existingfile, newfile)
 
     def file_test(self, cachefile, testfile, newfile):